@@ -1,11 +1,153 @@
-from typing import List, Optional, Dict
+import threading
+from weakref import getweakrefcount
+from array import array
+from itertools import islice
+from typing import List, Optional, Sequence
+
+# Optional accelerators for approach 4; everything else is pure Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Store buildTree's child index tables as int32 arrays from this many nodes
+# up. Below it plain lists are faster (array stores box/unbox every value);
+# above it the arrays cost no time and cut peak memory.
+TYPED_TABLE_THRESHOLD = 100_000
 
 # Definition for a binary tree node.
 class TreeNode:
+    # Fixed attribute slots instead of a per-instance __dict__: smaller nodes
+    # and faster .val/.left/.right access. __weakref__ keeps nodes usable as
+    # WeakKeyDictionary keys (e.g. isValidBST_cached).
+    __slots__ = ('val', 'left', 'right', '__weakref__')
+    
     def __init__(self, val=0, left=None, right=None):
         self.val = val
         self.left = left
         self.right = right
+    
+    @staticmethod
+    def release_tree(root: Optional['TreeNode']) -> None:
+        """
+        Return every node of a tree to the calling thread's freelist.
+        
+        Only pass the root of a whole tree that nothing else references.
+        Releasing a subtree leaves its old parent pointing at nodes that a
+        later build may reuse; releasing that parent afterwards would then
+        wipe nodes of the new, live tree.
+        
+        Released nodes are only reused by _link_nodes, i.e. by buildTree on
+        non-monotone inputs and by buildTree_v4, on the same thread. The
+        skewed-chain path of buildTree (_build_chain), buildTree_v3 and plain
+        TreeNode(...) construction always allocate new nodes. Each node is
+        marked as released when it is queued, so releasing the same tree
+        twice, or a subtree after its parent, is a no-op.
+        
+        Nodes that are still weakly referenced (e.g. keys in isValidBST_cached's
+        cache) are not recycled, so a cached result can never follow a node
+        into an unrelated tree; they are freed normally once dropped. The tree
+        must not be used afterwards.
+        """
+        push_free = _node_pool().append
+        stack = []
+        if root is not None and root.val is not _RELEASED:
+            root.val = _RELEASED
+            stack.append(root)
+        
+        while stack:
+            node = stack.pop()
+            left = node.left
+            right = node.right
+            if left is not None and left.val is not _RELEASED:
+                left.val = _RELEASED
+                stack.append(left)
+            if right is not None and right.val is not _RELEASED:
+                right.val = _RELEASED
+                stack.append(right)
+            node.left = node.right = None
+            if type(node) is TreeNode and not getweakrefcount(node):
+                push_free(node)
+
+
+# Marks a node that currently sits in a freelist
+_RELEASED = object()
+
+# Per-thread freelists of released TreeNodes
+_freelist = threading.local()
+
+
+def _node_pool() -> List[TreeNode]:
+    """Return the calling thread's freelist, creating it on first use."""
+    pool = getattr(_freelist, 'nodes', None)
+    if pool is None:
+        pool = _freelist.nodes = []
+    return pool
+
+
+def _build_indices(pre_pos, left_child, right_child, stack):
+    """
+    Fill child index arrays for the tree described by pre_pos.
+    
+    Node i is preorder[i]; the root is always node 0. Works on any indexable
+    int sequences, and is compiled with Numba when it is installed.
+    
+    Args:
+        pre_pos: pre_pos[i] is the inorder position of preorder[i]
+        left_child: Output, left_child[i] is the left child of node i (or -1)
+        right_child: Output, right_child[i] is the right child of node i (or -1)
+        stack: Scratch space of length 4 * n for (parent, side, lb, rb) items
+    """
+    n = len(pre_pos)
+    
+    # Root work item: no parent, whole inorder range
+    stack[0] = -1
+    stack[1] = 0
+    stack[2] = 0
+    stack[3] = n - 1
+    top = 4
+    i = 0
+    
+    while top > 0:
+        top -= 4
+        parent = stack[top]
+        side = stack[top + 1]
+        left_bound = stack[top + 2]
+        right_bound = stack[top + 3]
+        
+        # Attach node i to its parent (side 0 = left, 1 = right)
+        if parent >= 0:
+            if side == 0:
+                left_child[parent] = i
+            else:
+                right_child[parent] = i
+        
+        mid = pre_pos[i]
+        
+        # Push right before left so the left subtree takes the next preorder slot
+        if mid < right_bound:
+            stack[top] = i
+            stack[top + 1] = 1
+            stack[top + 2] = mid + 1
+            stack[top + 3] = right_bound
+            top += 4
+        if left_bound < mid:
+            stack[top] = i
+            stack[top + 1] = 0
+            stack[top + 2] = left_bound
+            stack[top + 3] = mid - 1
+            top += 4
+        
+        i += 1
+
+
+_build_indices_jit = njit(cache=True)(_build_indices) if njit is not None else None
+
 
 class Solution:
     """
@@ -19,11 +161,11 @@ class Solution:
     
     APPROACH COMPARISON:
     
-    1. Recursive with HashMap (RECOMMENDED - Optimal)
-       Summary: Use hashmap for O(1) inorder index lookup, recursively build subtrees
+    1. Divide and Conquer with HashMap (RECOMMENDED - Optimal)
+       Summary: Use hashmap for O(1) inorder index lookup, build subtrees from an explicit work stack
        Time: O(n), Space: O(n)
     
-    2. Recursive without HashMap
+    2. Recursive without HashMap (binaryTreeFromPreInOrderTraversal_reference.py)
        Summary: Linear search in inorder array to find root position each time
        Time: O(n²) worst case, Space: O(n)
     
@@ -31,23 +173,33 @@ class Solution:
        Summary: Use stack to simulate recursion, track parent-child relationships
        Time: O(n), Space: O(n)
     
+    4. Numba-compiled Index Build (optional, needs numpy + numba)
+       Summary: Compute child indices in a compiled loop, then wire TreeNodes once
+       Time: O(n), Space: O(n)
+    
     WHY APPROACH 1 IS BEST:
     - O(n) time complexity (optimal, must visit each node once)
-    - Cleaner, more intuitive recursive logic
+    - Same intuitive divide-and-conquer logic as the recursive form, without recursion depth limits
     - Hashmap eliminates repeated linear searches in approach 2
     - More readable than iterative stack-based approach 3
     """
     
     # ========================================================================
-    # APPROACH 1: RECURSIVE WITH HASHMAP (OPTIMAL) ⭐
+    # APPROACH 1: DIVIDE AND CONQUER WITH HASHMAP (OPTIMAL) ⭐
     # ========================================================================
     
     def buildTree(self, preorder: List[int], inorder: List[int]) -> Optional[TreeNode]:
         """
-        Construct binary tree using recursive approach with hashmap optimization.
+        Construct binary tree using divide and conquer with hashmap optimization.
+        
+        The recursion is driven by an explicit stack of work items instead of
+        the Python call stack, so skewed inputs deeper than the recursion limit
+        do not raise RecursionError and no frame is allocated per node. The
+        stack pass only computes child indices; TreeNodes are allocated and
+        wired afterwards in one straight loop (see _link_nodes).
         
         Time Complexity: O(n) - visit each node exactly once
-        Space Complexity: O(n) - hashmap storage + O(h) recursion stack where h is height
+        Space Complexity: O(n) - hashmap storage, child index arrays and work stack
         
         Args:
             preorder: Preorder traversal [root, left subtree, right subtree]
@@ -56,118 +208,123 @@ class Solution:
         Returns:
             Root node of the constructed binary tree
         """
+        if not preorder:
+            return None
+        
+        # Degenerate shapes: identical orders mean every node is the right
+        # child of the previous one, reversed orders mean every node is the
+        # left child. Build the chain directly without any index lookup.
+        if preorder == inorder:
+            return self._build_chain(preorder, left=False)
+        if preorder == inorder[::-1]:
+            return self._build_chain(preorder, left=True)
+        
         # Build hashmap: value -> index in inorder array
         # This allows O(1) lookup instead of O(n) linear search
-        inorder_index_map = {val: idx for idx, val in enumerate(inorder)}
-        
-        # Track current position in preorder array (next root to process)
-        self.preorder_idx = 0
-        
-        # Recursively build the tree
-        return self._build_recursive(
-            preorder, 
-            inorder_index_map, 
-            left_bound=0, 
-            right_bound=len(inorder) - 1
-        )
+        n = len(inorder)
+        inorder_index_map = dict(zip(inorder, range(n)))
+        
+        # Inorder position of each preorder value, produced lazily at C level
+        positions = map(inorder_index_map.__getitem__, preorder)
+        
+        # Index-only pass: node i is preorder[i]. Each work item is
+        # (children, parent, left_bound, right_bound): build the subtree for
+        # inorder[left_bound..right_bound] and record its root as
+        # children[parent], where children is left_child or right_child.
+        # No TreeNodes are touched here; see _link_nodes for the wiring.
+        # Large trees use int32 arrays for the child tables: 4 bytes per entry
+        # instead of a list pointer plus a boxed int kept alive per index.
+        if n >= TYPED_TABLE_THRESHOLD:
+            left_child = array('i', [-1]) * n
+            right_child = array('i', [-1]) * n
+        else:
+            left_child = [-1] * n
+            right_child = [-1] * n
+        
+        # The root has no parent; record it in a throwaway slot
+        stack = [([0], 0, 0, n - 1)]
+        
+        # Bind bound methods to locals once
+        push = stack.append
+        pop = stack.pop
+        
+        for i, root_inorder_idx in enumerate(positions):
+            children, parent, left_bound, right_bound = pop()
+            children[parent] = i
+            
+            # Push right before left so the left subtree takes the next
+            # preorder slot, matching the recursive version.
+            # Empty ranges are never pushed.
+            if root_inorder_idx < right_bound:
+                push((right_child, i, root_inorder_idx + 1, right_bound))
+            if left_bound < root_inorder_idx:
+                push((left_child, i, left_bound, root_inorder_idx - 1))
+        
+        return self._link_nodes(preorder, left_child, right_child)
     
-    def _build_recursive(
-        self, 
-        preorder: List[int], 
-        inorder_index_map: Dict[int, int],
-        left_bound: int, 
-        right_bound: int
-    ) -> Optional[TreeNode]:
+    def _link_nodes(self, preorder: List[int], left_child: Sequence[int], right_child: Sequence[int]) -> TreeNode:
         """
-        Recursively construct subtree for inorder range [left_bound, right_bound].
+        Allocate one TreeNode per preorder value and wire children by index.
         
-        Algorithm:
-        1. Base case: if left_bound > right_bound, return None (empty subtree)
-        2. Get next root value from preorder (current preorder_idx)
-        3. Find root's position in inorder to split left/right subtrees
-        4. Recursively build left subtree (elements before root in inorder)
-        5. Recursively build right subtree (elements after root in inorder)
+        Node i holds preorder[i]; -1 marks a missing child. A trailing None in
+        the node list makes nodes[-1] the missing child. Nodes come from this
+        thread's freelist (see TreeNode.release_tree) first; the rest are
+        created with TreeNode.__new__ only, skipping __init__. The wiring loop
+        stores val, left and right exactly once each, so no field is written
+        twice.
         
         Args:
-            preorder: Preorder traversal array
-            inorder_index_map: Hashmap of value -> inorder index
-            left_bound: Left boundary of current subtree in inorder
-            right_bound: Right boundary of current subtree in inorder
+            preorder: Non-empty preorder traversal
+            left_child: left_child[i] is the preorder index of node i's left child, or -1
+            right_child: right_child[i] is the preorder index of node i's right child, or -1
             
         Returns:
-            Root node of the constructed subtree
+            Root node (preorder[0])
         """
-        # Base case: no elements in this subtree
-        if left_bound > right_bound:
-            return None
+        n = len(preorder)
+        pool = _node_pool()
+        reused = min(n, len(pool))
+        if reused:
+            nodes = pool[-reused:]
+            del pool[-reused:]
+        else:
+            nodes = []
         
-        # Get the next root value from preorder traversal
-        root_val = preorder[self.preorder_idx]
-        self.preorder_idx += 1  # Move to next element for future recursive calls
-        
-        # Create the root node
-        root = TreeNode(root_val)
-        
-        # Find the root's position in inorder array using hashmap (O(1))
-        root_inorder_idx = inorder_index_map[root_val]
-        
-        # Recursively build left subtree
-        # Left subtree contains elements from left_bound to (root_position - 1) in inorder
-        root.left = self._build_recursive(
-            preorder, 
-            inorder_index_map, 
-            left_bound, 
-            root_inorder_idx - 1
-        )
-        
-        # Recursively build right subtree
-        # Right subtree contains elements from (root_position + 1) to right_bound in inorder
-        root.right = self._build_recursive(
-            preorder, 
-            inorder_index_map, 
-            root_inorder_idx + 1, 
-            right_bound
-        )
+        new_node = TreeNode.__new__
+        nodes += [new_node(TreeNode) for _ in range(n - reused)]
+        nodes.append(None)
         
-        return root
-    
-    # ========================================================================
-    # APPROACH 2: RECURSIVE WITHOUT HASHMAP (LESS EFFICIENT)
-    # ========================================================================
+        for node, val, left, right in zip(nodes, preorder, left_child, right_child):
+            node.val = val
+            node.left = nodes[left]
+            node.right = nodes[right]
+        
+        return nodes[0]
     
-    def buildTree_v2(self, preorder: List[int], inorder: List[int]) -> Optional[TreeNode]:
+    def _build_chain(self, preorder: List[int], left: bool) -> TreeNode:
         """
-        Construct binary tree using recursive approach WITHOUT hashmap.
-        
-        Time Complexity: O(n²) worst case - O(n) linear search for each of n nodes
-        Space Complexity: O(n) - recursion stack only
+        Build a skewed tree where each preorder value is the child of the previous one.
         
-        DRAWBACK: Performs linear search in inorder array for each node,
-                  leading to O(n²) time in worst case (skewed tree)
+        Args:
+            preorder: Non-empty preorder traversal
+            left: Link each node as the left child (True) or right child (False)
+            
+        Returns:
+            Root node of the chain
         """
-        self.preorder_idx = 0
-        return self._build_without_map(preorder, inorder, 0, len(inorder) - 1)
-    
-    def _build_without_map(
-        self, 
-        preorder: List[int], 
-        inorder: List[int],
-        left_bound: int, 
-        right_bound: int
-    ) -> Optional[TreeNode]:
-        """Helper method that performs linear search in inorder array."""
-        if left_bound > right_bound:
-            return None
-        
-        root_val = preorder[self.preorder_idx]
-        self.preorder_idx += 1
-        root = TreeNode(root_val)
-        
-        # Linear search for root in inorder (O(n) per call) ❌
-        root_inorder_idx = inorder.index(root_val, left_bound, right_bound + 1)
+        make_node = TreeNode
+        root = prev = make_node(preorder[0])
         
-        root.left = self._build_without_map(preorder, inorder, left_bound, root_inorder_idx - 1)
-        root.right = self._build_without_map(preorder, inorder, root_inorder_idx + 1, right_bound)
+        if left:
+            for val in islice(preorder, 1, None):
+                node = make_node(val)
+                prev.left = node
+                prev = node
+        else:
+            for val in islice(preorder, 1, None):
+                node = make_node(val)
+                prev.right = node
+                prev = node
         
         return root
     
@@ -190,32 +347,81 @@ class Solution:
         if not preorder:
             return None
         
-        root = TreeNode(preorder[0])
+        make_node = TreeNode
+        root = make_node(preorder[0])
         stack = [root]
+        push = stack.append
+        pop = stack.pop
         inorder_idx = 0
         
+        # Stack top and the next inorder value are kept in locals and only
+        # refreshed when the stack or inorder_idx changes
+        top = root
+        target = inorder[0]
+        
         # Process each preorder element (except first, already used for root)
-        for i in range(1, len(preorder)):
-            current_val = preorder[i]
-            node = TreeNode(current_val)
+        for current_val in islice(preorder, 1, None):
+            node = make_node(current_val)
             parent = None
             
             # Check if we've finished processing left subtree
             # If stack top matches inorder element, we've completed its left subtree
-            while stack and stack[-1].val == inorder[inorder_idx]:
-                parent = stack.pop()
+            while stack:
+                if top.val != target:
+                    break
+                parent = top
+                pop()
                 inorder_idx += 1
+                target = inorder[inorder_idx]
+                top = stack[-1] if stack else None
             
-            if parent:
+            if parent is not None:
                 # Finished left subtree, attach as right child
                 parent.right = node
             else:
                 # Still building left subtree, attach as left child
-                stack[-1].left = node
+                top.left = node
             
-            stack.append(node)
+            push(node)
+            top = node
         
         return root
+    
+    # ========================================================================
+    # APPROACH 4: NUMBA-COMPILED INDEX BUILD (OPTIONAL)
+    # ========================================================================
+    
+    def buildTree_v4(self, preorder: List[int], inorder: List[int]) -> Optional[TreeNode]:
+        """
+        Construct binary tree by computing child indices in compiled code.
+        
+        Time Complexity: O(n) - one compiled pass plus one wiring pass
+        Space Complexity: O(n) - int32 index arrays and work stack
+        
+        Algorithm:
+        - Map each preorder value to its inorder position (int32 array)
+        - Run _build_indices under Numba to fill left/right child arrays
+        - Allocate TreeNodes and wire .left/.right from the arrays in one pass
+        
+        Falls back to buildTree when numpy or numba is not installed. Values
+        never enter NumPy (only their int32 inorder positions do), so any
+        hashable values work, including ints outside int64.
+        """
+        if not preorder:
+            return None
+        if _build_indices_jit is None:
+            return self.buildTree(preorder, inorder)
+        
+        n = len(preorder)
+        inorder_index_map = dict(zip(inorder, range(n)))
+        pre_pos = np.fromiter(map(inorder_index_map.__getitem__, preorder), dtype=np.int32, count=n)
+        
+        left_child = np.full(n, -1, dtype=np.int32)
+        right_child = np.full(n, -1, dtype=np.int32)
+        stack = np.empty(4 * n, dtype=np.int32)
+        _build_indices_jit(pre_pos, left_child, right_child, stack)
+        
+        return self._link_nodes(preorder, left_child.tolist(), right_child.tolist())
 
 
 # ============================================================================
@@ -273,14 +479,15 @@ Final tree constructed!
 ┌──────────────────────┬─────────────────┬──────────────────┬────────────────┐
 │ Approach             │ Time Complexity │ Space Complexity │ Recommended?   │
 ├──────────────────────┼─────────────────┼──────────────────┼────────────────┤
-│ Recursive + HashMap  │ O(n)            │ O(n)             │ ✅ YES (Best)  │
+│ D&C + HashMap        │ O(n)            │ O(n)             │ ✅ YES (Best)  │
 │ Recursive (no map)   │ O(n²)           │ O(n)             │ ❌ NO          │
 │ Iterative + Stack    │ O(n)            │ O(n)             │ ⚠️  Alternative│
+│ Numba index build    │ O(n)            │ O(n)             │ ⚠️  Large n    │
 └──────────────────────┴─────────────────┴──────────────────┴────────────────┘
 
 WHY APPROACH 1 IS OPTIMAL:
 ✅ O(n) time - must visit each node, can't do better
-✅ Clean recursive logic - easy to understand and maintain
+✅ Clean divide-and-conquer logic - no recursion depth limit
 ✅ Hashmap eliminates redundant searches
 ✅ Industry standard solution
 """
\ No newline at end of file
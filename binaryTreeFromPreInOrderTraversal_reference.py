@@ -0,0 +1,187 @@
+import random
+from typing import List, Optional, Tuple
+
+from binaryTreeFromPreInOrderTraversal import Solution as OptimizedSolution, TreeNode
+from isValidBst import Solution as ValidatorSolution, pack_tree
+
+
+class Solution:
+    """
+    Reference implementation of approach 2 (recursive without hashmap).
+    
+    Kept out of the main Solution class so the quadratic path cannot be
+    picked up by accident; it is only used by cross_check below, which
+    compares the optimized versions against it on small random inputs.
+    cross_check_validators does the same for isValidBst's Solution.
+    Run it manually with: python binaryTreeFromPreInOrderTraversal_reference.py
+    """
+    
+    # ========================================================================
+    # APPROACH 2: RECURSIVE WITHOUT HASHMAP (LESS EFFICIENT)
+    # ========================================================================
+    
+    def buildTree_v2(self, preorder: List[int], inorder: List[int]) -> Optional[TreeNode]:
+        """
+        Construct binary tree using recursive approach WITHOUT hashmap.
+        
+        Time Complexity: O(n²) worst case - O(n) linear search for each of n nodes
+        Space Complexity: O(n) - recursion stack only
+        
+        DRAWBACK: Performs linear search in inorder array for each node,
+                  leading to O(n²) time in worst case (skewed tree)
+        """
+        # Current position in preorder, kept in the enclosing frame so the
+        # helper reads it as a closure cell instead of an instance attribute
+        preorder_idx = 0
+        
+        def build(left_bound: int, right_bound: int) -> Optional[TreeNode]:
+            """Helper that performs linear search in inorder array."""
+            nonlocal preorder_idx
+            root_val = preorder[preorder_idx]
+            preorder_idx += 1
+            root = TreeNode(root_val)
+            
+            # Linear search for root in inorder (O(n) per call) ❌
+            root_inorder_idx = inorder.index(root_val, left_bound, right_bound + 1)
+            
+            # Only recurse into non-empty ranges; TreeNode already defaults
+            # left/right to None, so leaves make no further calls
+            if root_inorder_idx > left_bound:
+                root.left = build(left_bound, root_inorder_idx - 1)
+            if root_inorder_idx < right_bound:
+                root.right = build(root_inorder_idx + 1, right_bound)
+            
+            return root
+        
+        if not preorder:
+            return None
+        return build(0, len(inorder) - 1)
+
+
+# ============================================================================
+# CROSS-CHECK (manual use: python binaryTreeFromPreInOrderTraversal_reference.py)
+# ============================================================================
+
+def _random_traversals(rng: random.Random, n: int) -> Tuple[List[int], List[int]]:
+    """Random tree of n unique values, returned as (preorder, inorder)."""
+    # Mix dense value ranges (array index) with sparse ones (dict fallback)
+    span = rng.choice([2 * n + 1, 10 ** 6])
+    inorder = rng.sample(range(-span, span + 1), n)
+    
+    # Pick a random root in each inorder range; emitting it before its
+    # subtrees (left popped first) yields the matching preorder
+    preorder = []
+    stack = [(0, n - 1)]
+    while stack:
+        left_bound, right_bound = stack.pop()
+        if left_bound > right_bound:
+            continue
+        mid = rng.randint(left_bound, right_bound)
+        preorder.append(inorder[mid])
+        stack.append((mid + 1, right_bound))
+        stack.append((left_bound, mid - 1))
+    
+    return preorder, inorder
+
+
+def _serialize(root: Optional[TreeNode]) -> List[Optional[int]]:
+    """Preorder values with None for missing children; equal lists mean equal trees."""
+    out = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            out.append(None)
+            continue
+        out.append(node.val)
+        stack.append(node.right)
+        stack.append(node.left)
+    return out
+
+
+def cross_check(trials: int = 500, max_size: int = 60, seed: int = 0) -> None:
+    """
+    Compare buildTree, buildTree_v3 and buildTree_v4 against buildTree_v2.
+    
+    Raises AssertionError naming the method and inputs on the first mismatch.
+    """
+    rng = random.Random(seed)
+    reference = Solution()
+    optimized = OptimizedSolution()
+    
+    for _ in range(trials):
+        preorder, inorder = _random_traversals(rng, rng.randint(0, max_size))
+        expected = _serialize(reference.buildTree_v2(preorder, inorder))
+        
+        for name in ('buildTree', 'buildTree_v3', 'buildTree_v4'):
+            got = _serialize(getattr(optimized, name)(list(preorder), list(inorder)))
+            assert got == expected, f"{name} mismatch for preorder={preorder}, inorder={inorder}"
+
+
+def _is_valid_bst_reference(node: Optional[TreeNode], low=None, high=None) -> bool:
+    """Recursive (low, high) bounds check; the plain textbook validator."""
+    if node is None:
+        return True
+    if (low is not None and node.val <= low) or (high is not None and node.val >= high):
+        return False
+    return (_is_valid_bst_reference(node.left, low, node.val)
+            and _is_valid_bst_reference(node.right, node.val, high))
+
+
+def cross_check_validators(trials: int = 500, max_size: int = 60, seed: int = 0) -> None:
+    """
+    Compare isValidBST, isValidBST_morris, isValidBST_cached and
+    isValidBST_packed against the recursive bounds check.
+    
+    Trees are valid BSTs (sorted inorder), BSTs with two values swapped or
+    one value duplicated, and random trees. Also asserts that the Morris
+    walk leaves the tree exactly as it found it and that repeated cached
+    calls (one shared cache across trials) agree.
+    """
+    rng = random.Random(seed)
+    builder = OptimizedSolution()
+    validator = ValidatorSolution()
+    
+    for _ in range(trials):
+        preorder, inorder = _random_traversals(rng, rng.randint(0, max_size))
+        root = builder.buildTree(preorder, inorder)
+        
+        # Turn most trees into BSTs by relabelling inorder with sorted values,
+        # then break some of them in ways the checks must catch
+        kind = rng.randrange(4)
+        if kind and inorder:
+            nodes = []
+            stack = []
+            node = root
+            while stack or node is not None:
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+                node = stack.pop()
+                nodes.append(node)
+                node = node.right
+            values = sorted(inorder)
+            if kind == 2 and len(values) > 1:
+                i, j = rng.sample(range(len(values)), 2)
+                values[i], values[j] = values[j], values[i]
+            elif kind == 3 and len(values) > 1:
+                i = rng.randrange(len(values) - 1)
+                values[i + 1] = values[i]
+            for node, val in zip(nodes, values):
+                node.val = val
+        
+        expected = _is_valid_bst_reference(root)
+        shape = _serialize(root)
+        
+        assert validator.isValidBST(root) == expected, f"isValidBST mismatch for {shape}"
+        assert validator.isValidBST_morris(root) == expected, f"isValidBST_morris mismatch for {shape}"
+        assert _serialize(root) == shape, f"isValidBST_morris left threads in {shape}"
+        for _ in range(2):
+            assert validator.isValidBST_cached(root) == expected, f"isValidBST_cached mismatch for {shape}"
+        assert validator.isValidBST_packed(*pack_tree(root)) == expected, f"isValidBST_packed mismatch for {shape}"
+
+
+if __name__ == '__main__':
+    cross_check()
+    cross_check_validators()
+    print("cross-check passed")